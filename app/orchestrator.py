@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import importlib
+from typing import Optional
+
+from app.settings import SETTINGS
+from usecases.create_drafts import LLMOrchestrator
+
+# Web プロセス (app.server) と arq ワーカー (app.worker) の両方が参照する LLMOrchestrator の登録先。
+# 起動時に configure_orchestrator() で直接セットするか、ORCHESTRATOR_FACTORY で生成関数を指定する。
+_orchestrator: Optional[LLMOrchestrator] = None
+
+
+def configure_orchestrator(orchestrator: LLMOrchestrator) -> None:
+    global _orchestrator
+    _orchestrator = orchestrator
+
+
+def get_orchestrator() -> LLMOrchestrator:
+    if _orchestrator is None:
+        raise RuntimeError(
+            "LLMOrchestrator is not configured. Set ORCHESTRATOR_FACTORY or call configure_orchestrator() at startup."
+        )
+    return _orchestrator
+
+
+def configure_orchestrator_from_settings() -> bool:
+    """ORCHESTRATOR_FACTORY ("package.module:callable") が設定されていれば、その戻り値を登録する。
+
+    設定されていなければ何もせず False を返す。
+    """
+    factory_path = SETTINGS.orchestrator_factory
+    if not factory_path:
+        return False
+    module_name, _, attr = factory_path.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"ORCHESTRATOR_FACTORY must be 'package.module:callable': {factory_path!r}")
+    factory = getattr(importlib.import_module(module_name), attr)
+    configure_orchestrator(factory())
+    return True
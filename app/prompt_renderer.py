@@ -1,26 +1,79 @@
 from __future__ import annotations
 
-import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from string import Template
-from typing import List
+from typing import Any, Dict, List
 
+import orjson
 import yaml
+from pydantic import BaseModel
 
 from domain.models import ArticleBrief, ArticleDraft, ArticlePlan, BatchBrief, OutlineItem, SectionDraft
 from usecases.ports import PromptRendererPort, SiteAdapterPort
 
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # pragma: no cover - libyaml が無い環境
+    _YamlLoader = yaml.SafeLoader
+
+
+def _default(obj: Any) -> Any:
+    # Pydantic モデルは .dict() で中間 dict を組み立てず、フィールド値をそのまま orjson にたどらせる
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj: Any, *, indent: bool = True) -> str:
+    """orjson でシリアライズする。非 ASCII はそのまま出力され、Pydantic モデルも直接渡せる。"""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_default, option=option).decode()
+
+
+# string.Template の記法 ($$, ${name}, $name) と、format_map でエスケープが必要な波括弧
+_PLACEHOLDER_RE = re.compile(r"\$(?:(\$)|\{([_a-zA-Z][_a-zA-Z0-9]*)\}|([_a-zA-Z][_a-zA-Z0-9]*))|([{}])")
+
+
+class _SafeDict(dict):
+    """未指定のキーは safe_substitute と同様にプレースホルダのまま残す。"""
+
+    def __missing__(self, key: str) -> str:
+        return f"${key}"
+
+
+def _to_format_template(text: str) -> str:
+    """string.Template 形式のテキストを str.format_map 用に変換する。"""
+
+    def replace(match: re.Match) -> str:
+        dollar, braced, named, brace = match.groups()
+        if dollar:
+            return "$"
+        if brace:
+            return brace * 2
+        return "{" + (braced or named) + "}"
+
+    return _PLACEHOLDER_RE.sub(replace, text)
+
+
+@lru_cache(maxsize=8)
+def _load_templates(path: str) -> Dict[str, str]:
+    """YAML を一度だけ読み込み、フェーズごとに format_map 用へ変換してキャッシュする。"""
+    raw = yaml.load(Path(path).read_text(encoding="utf-8"), Loader=_YamlLoader)
+    return {key: _to_format_template(value) for key, value in raw.items()}
+
 
 class PromptRenderer(PromptRendererPort):
     """YAML ベースのテンプレートから各フェーズのプロンプトを組み立てる。"""
 
     def __init__(self, template_path: Path | str | None = None):
         path = Path(template_path) if template_path else Path("app/prompts/default.yaml")
-        self.templates = yaml.safe_load(path.read_text(encoding="utf-8"))
+        self.templates = _load_templates(str(path))
 
-    def _render(self, key: str, **ctx: str) -> str:
-        template = Template(self.templates[key])
-        return template.safe_substitute(**ctx)
+    def _render(self, key: str, **ctx: Any) -> str:
+        return self.templates[key].format_map(_SafeDict(ctx))
 
     def render_plan_prompt(
         self,
@@ -36,12 +89,12 @@ class PromptRenderer(PromptRendererPort):
             topic=brief.topic,
             audience=brief.audience or "未指定",
             purpose=brief.purpose or "未指定",
-            constraints_json=json.dumps(constraints, ensure_ascii=False, indent=2),
+            constraints_json=_dumps(constraints),
             target_site=brief.target_site,
             seed_title=brief.seed_title or "",
-            existing_titles=json.dumps(existing_titles or [], ensure_ascii=False),
-            existing_angles=json.dumps(existing_angles or [], ensure_ascii=False),
-            existing_avoid=json.dumps(existing_avoid or [], ensure_ascii=False),
+            existing_titles=_dumps(existing_titles or [], indent=False),
+            existing_angles=_dumps(existing_angles or [], indent=False),
+            existing_avoid=_dumps(existing_avoid or [], indent=False),
         )
 
     def render_batch_plan_prompt(self, brief: BatchBrief) -> str:
@@ -51,7 +104,7 @@ class PromptRenderer(PromptRendererPort):
             topic=brief.topic,
             audience=brief.audience or "未指定",
             purpose=brief.purpose or "未指定",
-            constraints_json=json.dumps(constraints, ensure_ascii=False, indent=2),
+            constraints_json=_dumps(constraints),
             target_site=brief.target_site,
             desired_count=brief.desired_count,
         )
@@ -62,30 +115,36 @@ class PromptRenderer(PromptRendererPort):
         outline_item: OutlineItem,
         previous_sections: List[SectionDraft],
         site_adapter: SiteAdapterPort,
+        *,
+        plan_dict_cached: dict | None = None,
+        previous_sections_dicts: List[dict] | None = None,
     ) -> str:
+        # 呼び出し側が記事単位でキャッシュした dict があればそれを使う
         return self._render(
             "section_draft",
-            plan_json=json.dumps(plan.dict(), ensure_ascii=False, indent=2),
-            outline_item_json=json.dumps(outline_item.dict(), ensure_ascii=False, indent=2),
-            previous_sections_json=json.dumps([s.dict() for s in previous_sections], ensure_ascii=False, indent=2),
+            plan_json=_dumps(plan_dict_cached if plan_dict_cached is not None else plan),
+            outline_item_json=_dumps(outline_item),
+            previous_sections_json=_dumps(
+                previous_sections_dicts if previous_sections_dicts is not None else previous_sections
+            ),
         )
 
     def render_qc_soft_prompt(self, draft: ArticleDraft) -> str:
         return self._render(
             "qc_soft",
-            draft_json=json.dumps(draft.dict(), ensure_ascii=False, indent=2),
+            draft_json=_dumps(draft.qc_view()),
         )
 
     def render_revise_prompt(self, draft: ArticleDraft, instructions: List[str], targets: List[str]) -> str:
         return self._render(
             "revise",
-            draft_json=json.dumps(draft.dict(), ensure_ascii=False, indent=2),
-            instructions_json=json.dumps(instructions, ensure_ascii=False, indent=2),
-            targets_json=json.dumps(targets, ensure_ascii=False, indent=2),
+            draft_json=_dumps(draft),
+            instructions_json=_dumps(instructions),
+            targets_json=_dumps(targets),
         )
 
     def render_faq_prompt(self, draft: ArticleDraft) -> str:
         return self._render(
             "faq",
-            draft_json=json.dumps(draft.dict(), ensure_ascii=False, indent=2),
+            draft_json=_dumps(draft.faq_view()),
         )
@@ -1,37 +1,99 @@
 from __future__ import annotations
 
+import os
 import uuid
 from typing import Optional
 
+from arq.connections import ArqRedis, RedisSettings, create_pool
 from fastapi import BackgroundTasks, FastAPI, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from domain.models import BatchBrief, JobState, JobStatus
 from infrastructure.persistence.in_memory_job_store import InMemoryJobStore
 from infrastructure.wordpress.client import WordPressClient
-from usecases.create_drafts import LLMOrchestrator
+from usecases.ports import JobStorePort
 from usecases.run_batch_job import run_batch_job
-from app.settings import get_settings
+from app.orchestrator import configure_orchestrator, configure_orchestrator_from_settings, get_orchestrator
+from app.settings import SETTINGS
 
 app = FastAPI()
-templates = Jinja2Templates(directory="templates")
-job_store = InMemoryJobStore()
-settings = get_settings()
 
-# Orchestrator はアプリ起動時にセットすることを想定
-_orchestrator: Optional[LLMOrchestrator] = None
 
+def _build_templates() -> Jinja2Templates:
+    os.makedirs(SETTINGS.template_cache_dir, exist_ok=True)
+    return Jinja2Templates(
+        directory="templates",
+        auto_reload=SETTINGS.template_auto_reload,
+        bytecode_cache=FileSystemBytecodeCache(SETTINGS.template_cache_dir),
+    )
+
+
+templates = _build_templates()
+# 起動時にコンパイルしておき、最初のリクエストでのパースを避けるテンプレート
+_WARM_TEMPLATES = (
+    "pages/index.html",
+    "partials/progress.html",
+    "partials/progress_stream.html",
+    "partials/result.html",
+)
+
+
+@app.on_event("startup")
+def warm_templates() -> None:
+    for name in _WARM_TEMPLATES:
+        templates.get_template(name)
+
+
+def _build_job_store() -> JobStorePort:
+    if SETTINGS.redis_url:
+        from infrastructure.persistence.redis_job_store import RedisJobStore
+
+        return RedisJobStore.from_url(SETTINGS.redis_url)
+    return InMemoryJobStore()
+
+
+job_store = _build_job_store()
+
+# USE_TASK_QUEUE=true のとき起動時に接続する arq のキュー
+_task_queue: Optional[ArqRedis] = None
+
+
+@app.on_event("startup")
+async def connect_task_queue() -> None:
+    global _task_queue
+    if not SETTINGS.use_task_queue:
+        return
+    if not SETTINGS.redis_url:
+        raise RuntimeError("USE_TASK_QUEUE requires REDIS_URL.")
+    _task_queue = await create_pool(RedisSettings.from_dsn(SETTINGS.redis_url))
 
-def configure_orchestrator(orchestrator: LLMOrchestrator) -> None:
-    global _orchestrator
-    _orchestrator = orchestrator
 
+@app.on_event("shutdown")
+async def close_task_queue() -> None:
+    if _task_queue is not None:
+        await _task_queue.aclose()
 
-def get_orchestrator() -> LLMOrchestrator:
-    if _orchestrator is None:
-        raise RuntimeError("LLMOrchestrator is not configured. Call configure_orchestrator() at startup.")
-    return _orchestrator
+
+@app.on_event("startup")
+def load_orchestrator() -> None:
+    # ORCHESTRATOR_FACTORY 未設定なら、起動コード側で configure_orchestrator() を呼ぶ想定
+    configure_orchestrator_from_settings()
+
+
+# SSE 接続中に更新が無いときに keep-alive コメントを送る間隔（秒）
+SSE_KEEPALIVE_SECONDS = 15.0
+_TERMINAL_STATUSES = (JobStatus.done, JobStatus.failed)
+
+
+def _progress_snapshot(job: JobState) -> tuple:
+    return job.status, job.current, job.total, len(job.logs), len(job.results)
+
+
+def _sse_event(event: str, data: str, event_id: str) -> str:
+    lines = "".join(f"data: {line}\n" for line in data.splitlines())
+    return f"id: {event_id}\nevent: {event}\n{lines}\n"
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -41,10 +103,10 @@ def index(request: Request):
         {
             "request": request,
             "defaults": {
-                "wordpress_url": settings.wp_default_url,
-                "wordpress_username": settings.wp_default_username,
-                "wordpress_app_password": settings.wp_default_app_password,
-                "desired_count": settings.soft_qc_retries * 0 + 10,  # keep default 10
+                "wordpress_url": SETTINGS.wp_default_url,
+                "wordpress_username": SETTINGS.wp_default_username,
+                "wordpress_app_password": SETTINGS.wp_default_app_password,
+                "desired_count": SETTINGS.soft_qc_retries * 0 + 10,  # keep default 10
             },
         },
     )
@@ -75,37 +137,95 @@ async def run_job(
     )
 
     job = JobState(job_id=job_id, status=JobStatus.queued, total=desired_count, current=0, logs=[], results=[])
-    job_store.create(job)
-
-    background_tasks.add_task(
-        run_batch_job,
-        job_id,
-        batch_brief,
-        wordpress_url,
-        wordpress_username,
-        wordpress_app_password,
-        job_store,
-        get_orchestrator,
-    )
+    await job_store.create(job)
+
+    if _task_queue is not None:
+        # LLM 呼び出しで Web ワーカーを占有しないよう、別プロセスの arq ワーカー (app.worker) で実行する
+        await _task_queue.enqueue_job(
+            "run_batch_job_task",
+            job_id,
+            batch_brief.dict(),
+            wordpress_url,
+            wordpress_username,
+            wordpress_app_password,
+        )
+    else:
+        background_tasks.add_task(
+            run_batch_job,
+            job_id,
+            batch_brief,
+            wordpress_url,
+            wordpress_username,
+            wordpress_app_password,
+            job_store,
+            get_orchestrator,
+            SETTINGS.batch_concurrency,
+        )
 
     return templates.TemplateResponse(
-        "partials/progress.html", {"request": request, "job": job, "poll_interval": settings.poll_interval_seconds}
+        "partials/progress_stream.html",
+        {"request": request, "job": job, "poll_interval": SETTINGS.poll_interval_seconds, "stream": True},
     )
 
 
+@app.get("/progress/{job_id}/stream")
+async def progress_stream(job_id: str, request: Request):
+    """JobState が更新されたときだけ進捗パーシャルを SSE で push する。"""
+    job = await job_store.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    # 完了済みジョブへの再接続は 204 で返し、EventSource の自動再接続を止める
+    if job.status in _TERMINAL_STATUSES and request.headers.get("last-event-id"):
+        return Response(status_code=204)
+
+    template = templates.get_template("partials/progress.html")
+
+    async def event_generator():
+        seq = 0
+        current = job
+        last_sent = None
+        # 購読はストリームの間張り続け、購読開始後に状態を読み直すことで、その間の更新も取りこぼさない
+        async with job_store.subscribe(job_id) as updates:
+            while True:
+                current = await job_store.get(job_id) or current
+                # 送信中に入った更新を取りこぼさないよう、待機前に送信済みの状態と比較する
+                snapshot = _progress_snapshot(current)
+                if snapshot != last_sent:
+                    seq += 1
+                    html = template.render(
+                        {
+                            "request": request,
+                            "job": current,
+                            "poll_interval": SETTINGS.poll_interval_seconds,
+                            "stream": True,
+                        }
+                    )
+                    yield _sse_event("progress", html, str(seq))
+                    last_sent = snapshot
+                    if current.status in _TERMINAL_STATUSES:
+                        break
+                    continue
+                if not await updates.wait(timeout=SSE_KEEPALIVE_SECONDS):
+                    if await request.is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @app.get("/progress/{job_id}", response_class=HTMLResponse)
-def progress(job_id: str, request: Request):
-    job = job_store.get(job_id)
+async def progress(job_id: str, request: Request):
+    job = await job_store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return templates.TemplateResponse(
-        "partials/progress.html", {"request": request, "job": job, "poll_interval": settings.poll_interval_seconds}
+        "partials/progress.html", {"request": request, "job": job, "poll_interval": SETTINGS.poll_interval_seconds}
     )
 
 
 @app.get("/result/{job_id}", response_class=HTMLResponse)
-def result(job_id: str, request: Request):
-    job = job_store.get(job_id)
+async def result(job_id: str, request: Request):
+    job = await job_store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return templates.TemplateResponse("partials/result.html", {"request": request, "job": job})
@@ -11,11 +11,22 @@ class Settings(BaseSettings):
     app_port: int = Field(8000, env="APP_PORT")
     log_level: str = Field("info", env="LOG_LEVEL")
     poll_interval_seconds: int = Field(3, env="POLL_INTERVAL_SECONDS")
+    # 設定時は RedisJobStore を使い、複数ワーカー間でジョブ状態を共有する（未設定ならプロセス内メモリ）
+    redis_url: str = Field("", env="REDIS_URL")
+    # true の場合、/run のジョブを BackgroundTasks ではなく arq 経由で別プロセスのワーカーに渡す（REDIS_URL 必須）
+    use_task_queue: bool = Field(False, env="USE_TASK_QUEUE")
+    # テンプレート変更を毎リクエスト確認するか（開発時のみ true 推奨）と、Jinja バイトコードキャッシュの置き場所
+    template_auto_reload: bool = Field(False, env="TEMPLATE_AUTO_RELOAD")
+    template_cache_dir: str = Field(".jinja_cache", env="TEMPLATE_CACHE_DIR")
 
     model_name: str = Field("gpt-4", env="MODEL_NAME")
     model_temperature: float = Field(0.7, env="MODEL_TEMPERATURE")
     model_max_tokens: Optional[int] = Field(None, env="MODEL_MAX_TOKENS")
     soft_qc_retries: int = Field(2, env="SOFT_QC_RETRIES")
+    # LLMOrchestrator を返す生成関数 ("package.module:callable")。Web / arq ワーカーの起動時に呼び出す
+    orchestrator_factory: str = Field("", env="ORCHESTRATOR_FACTORY")
+    # バッチ内で同時に生成・投稿する記事数（LLM プロバイダのレート制限に合わせる）
+    batch_concurrency: int = Field(5, env="BATCH_CONCURRENCY")
 
     # WordPress defaults（入力優先、ここはデフォルト値）
     wp_default_url: str = Field("", env="WP_DEFAULT_URL")
@@ -25,8 +36,13 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
+        allow_mutation = False
 
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
+
+
+# 起動時に一度だけ env/.env を読み込んだ設定。ホットパスでは get_settings() を呼ばずにこれを参照する。
+SETTINGS: Settings = get_settings()
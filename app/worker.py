@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from arq.connections import RedisSettings
+
+from app.orchestrator import configure_orchestrator_from_settings, get_orchestrator
+from app.settings import SETTINGS
+from domain.models import BatchBrief
+from infrastructure.persistence.redis_job_store import RedisJobStore
+from usecases.run_batch_job import run_batch_job
+
+# arq ワーカー（`arq app.worker.WorkerSettings` で起動）。
+# LLMOrchestrator は ORCHESTRATOR_FACTORY で指定した生成関数から起動時に組み立てる。
+
+
+async def run_batch_job_task(
+    ctx: Dict[str, Any],
+    job_id: str,
+    batch_brief_data: Dict[str, Any],
+    wordpress_url: str,
+    wordpress_username: str,
+    wordpress_app_password: str,
+) -> None:
+    await run_batch_job(
+        job_id,
+        BatchBrief.parse_obj(batch_brief_data),
+        wordpress_url,
+        wordpress_username,
+        wordpress_app_password,
+        ctx["job_store"],
+        get_orchestrator,
+        SETTINGS.batch_concurrency,
+    )
+
+
+async def startup(ctx: Dict[str, Any]) -> None:
+    if not SETTINGS.redis_url:
+        raise RuntimeError("REDIS_URL is required to run the task queue worker.")
+    configure_orchestrator_from_settings()
+    # 未設定のままキューのジョブを 1 件ずつ失敗させないよう、起動時に確認する
+    get_orchestrator()
+    # 進捗は Web ワーカーから参照されるため、ワーカー側も Redis の JobStore に書き込む
+    ctx["job_store"] = RedisJobStore.from_url(SETTINGS.redis_url)
+
+
+async def shutdown(ctx: Dict[str, Any]) -> None:
+    job_store = ctx.get("job_store")
+    if job_store is not None:
+        await job_store.aclose()
+
+
+class WorkerSettings:
+    functions = [run_batch_job_task]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(SETTINGS.redis_url) if SETTINGS.redis_url else RedisSettings()
+    # 1 ジョブで 10 本前後の記事を LLM で生成するため、arq 既定 (300 秒) より長く取る
+    job_timeout = 60 * 60
+    max_tries = 1
@@ -15,6 +15,7 @@ from .llm_generation import (
     BatchBrief,
     BatchPlanItem,
     JobStatus,
+    JobResultItem,
     JobState,
 )
 
@@ -35,5 +36,6 @@ __all__ = [
     "BatchBrief",
     "BatchPlanItem",
     "JobStatus",
+    "JobResultItem",
     "JobState",
 ]
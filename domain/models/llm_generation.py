@@ -5,6 +5,10 @@ from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field, validator
 
+# 他モデルへ埋め込まれるモデルは copy_on_model_validation = "none" とし、
+# 親モデル生成時 (ArticleDraft(outline=plan.outline, sections=...) など) の再コピーを避ける。
+# 埋め込み先とはインスタンスが共有される点に注意。
+
 
 class ArticleBrief(BaseModel):
     """入力ブリーフ。Plan 生成の起点。"""
@@ -41,6 +45,7 @@ class OutlineH3(BaseModel):
 
     class Config:
         extra = "forbid"
+        copy_on_model_validation = "none"
 
     @validator("id")
     def id_must_have_prefix(cls, value: str) -> str:
@@ -60,6 +65,7 @@ class OutlineItem(BaseModel):
 
     class Config:
         extra = "forbid"
+        copy_on_model_validation = "none"
 
     @validator("id")
     def id_must_have_prefix(cls, value: str) -> str:
@@ -89,6 +95,7 @@ class SectionH3Draft(BaseModel):
 
     class Config:
         extra = "forbid"
+        copy_on_model_validation = "none"
 
 
 class SectionDraft(BaseModel):
@@ -99,6 +106,7 @@ class SectionDraft(BaseModel):
 
     class Config:
         extra = "forbid"
+        copy_on_model_validation = "none"
 
 
 class ArticleDraft(BaseModel):
@@ -118,6 +126,24 @@ class ArticleDraft(BaseModel):
     class Config:
         extra = "forbid"
 
+    def qc_view(self) -> dict:
+        """ソフト QC プロンプト用の dict。本文は sections に含まれるため markdown と faq は除く。"""
+        return self.dict(
+            include={
+                "title",
+                "meta_description",
+                "outline",
+                "sections",
+                "volatile_topics",
+                "safe_assertions",
+                "quality_self_check",
+            }
+        )
+
+    def faq_view(self) -> dict:
+        """FAQ 生成プロンプト用の dict。記事内容 (sections) と断定可否の情報のみに絞る。"""
+        return self.dict(include={"title", "meta_description", "sections", "volatile_topics", "safe_assertions"})
+
 
 class QualitySelfCheck(BaseModel):
     meta_description_length: int
@@ -132,6 +158,7 @@ class QualitySelfCheck(BaseModel):
 
     class Config:
         extra = "forbid"
+        copy_on_model_validation = "none"
 
 
 class QcSeverity(str, Enum):
@@ -147,6 +174,7 @@ class QcIssue(BaseModel):
 
     class Config:
         extra = "forbid"
+        copy_on_model_validation = "none"
 
 
 class QcReport(BaseModel):
@@ -180,6 +208,7 @@ class BatchPlanItem(BaseModel):
 
     class Config:
         extra = "forbid"
+        copy_on_model_validation = "none"
 
 
 class BatchPlan(BaseModel):
@@ -208,6 +237,7 @@ class JobResultItem(BaseModel):
 
     class Config:
         extra = "forbid"
+        copy_on_model_validation = "none"
 
 
 class JobState(BaseModel):
@@ -1,28 +1,61 @@
 from __future__ import annotations
 
-import threading
-from typing import Dict, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
 
 from domain.models import JobState
 from usecases.ports import JobStorePort
 
 
-class InMemoryJobStore(JobStorePort):
-    """シンプルなスレッドセーフなメモリ上の JobStore。"""
-
+class _MemorySubscription:
     def __init__(self) -> None:
-        self._jobs: Dict[str, JobState] = {}
-        self._lock = threading.Lock()
+        self._event = asyncio.Event()
+
+    def notify(self) -> None:
+        self._event.set()
 
-    def create(self, job: JobState) -> None:
-        with self._lock:
-            self._jobs[job.job_id] = job
+    async def wait(self, timeout: float | None = None) -> bool:
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
 
-    def get(self, job_id: str) -> Optional[JobState]:
-        with self._lock:
-            return self._jobs.get(job_id)
 
-    def update(self, job: JobState) -> None:
-        with self._lock:
-            self._jobs[job.job_id] = job
+class InMemoryJobStore(JobStorePort):
+    """シンプルなメモリ上の JobStore。
+
+    各操作は dict への単一の参照/代入のみで、GIL 下でアトミックなためロックは取らない。
+    JobState は参照で保持されるので、update 時の状態の書き換えもロック不要。
+    """
 
+    def __init__(self) -> None:
+        self._jobs: Dict[str, JobState] = {}
+        # job_id -> 購読中の SSE ストリームなど
+        self._subscribers: Dict[str, Set[_MemorySubscription]] = {}
+
+    async def create(self, job: JobState) -> None:
+        self._jobs[job.job_id] = job
+
+    async def get(self, job_id: str) -> Optional[JobState]:
+        return self._jobs.get(job_id)
+
+    async def update(self, job: JobState) -> None:
+        self._jobs[job.job_id] = job
+        for subscription in tuple(self._subscribers.get(job.job_id, ())):
+            subscription.notify()
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str) -> AsyncIterator[_MemorySubscription]:
+        subscription = _MemorySubscription()
+        self._subscribers.setdefault(job_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[job_id]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import orjson
+import redis.asyncio as aioredis
+from redis.asyncio.client import PubSub
+
+from domain.models import JobState
+from usecases.ports import JobStorePort
+
+
+class _RedisSubscription:
+    def __init__(self, pubsub: PubSub) -> None:
+        self._pubsub = pubsub
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+            if message is not None:
+                return True
+
+
+class RedisJobStore(JobStorePort):
+    """Redis に JobState を保存し、更新を pub/sub で通知する JobStore。
+
+    状態は `HSET job:{id}` にフィールド単位で保存し、create/update のたびに同名チャンネルへ PUBLISH する。
+    複数の uvicorn ワーカーから同じジョブを参照・購読できる。
+    """
+
+    def __init__(
+        self,
+        client: aioredis.Redis,
+        *,
+        key_prefix: str = "job:",
+        ttl_seconds: Optional[int] = 24 * 60 * 60,
+    ) -> None:
+        self._client = client
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        # 並行する update の書き込みが入れ替わり、古い状態で上書きしないよう直列化する
+        self._write_lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisJobStore":
+        return cls(aioredis.Redis.from_url(url), **kwargs)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.key_prefix}{job_id}"
+
+    @staticmethod
+    def _encode(job: JobState) -> Dict[str, bytes]:
+        return {name: orjson.dumps(value) for name, value in job.dict().items()}
+
+    @staticmethod
+    def _decode(raw: Dict[bytes, bytes]) -> JobState:
+        return JobState.parse_obj({name.decode(): orjson.loads(value) for name, value in raw.items()})
+
+    async def _save(self, job: JobState) -> None:
+        key = self._key(job.job_id)
+        async with self._write_lock:
+            pipe = self._client.pipeline()
+            pipe.hset(key, mapping=self._encode(job))
+            if self.ttl_seconds:
+                pipe.expire(key, self.ttl_seconds)
+            pipe.publish(key, job.status.value)
+            await pipe.execute()
+
+    async def create(self, job: JobState) -> None:
+        await self._save(job)
+
+    async def get(self, job_id: str) -> Optional[JobState]:
+        raw = await self._client.hgetall(self._key(job_id))
+        if not raw:
+            return None
+        return self._decode(raw)
+
+    async def update(self, job: JobState) -> None:
+        await self._save(job)
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str) -> AsyncIterator[_RedisSubscription]:
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(self._key(job_id))
+        try:
+            yield _RedisSubscription(pubsub)
+        finally:
+            await pubsub.aclose()
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import base64
-import time
+import hashlib
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Sequence
 
 import httpx
+import orjson
 
 from domain.models import ArticleDraft
 from usecases.ports import MarkdownRendererPort, SiteAdapterPort
@@ -34,17 +38,28 @@ class WordPressClient:
         timeout: float = 10.0,
         max_retries: int = 3,
         backoff_base: float = 0.5,
-        client: Optional[httpx.Client] = None,
+        max_retry_after: float = 60.0,
+        http2: bool = True,
+        max_keepalive_connections: int = 20,
+        client: Optional[httpx.AsyncClient] = None,
         markdown_renderer: Optional[MarkdownRendererPort] = None,
         convert_markdown: bool = True,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.auth_header = self._build_auth_header(username, app_password)
+        # リクエスト/リトライごとに dict を組み立てないよう、共通ヘッダは初期化時に確定させる
+        self._headers = {**self.auth_header, "Content-Type": "application/json", "Accept": "application/json"}
         self.site_adapter = site_adapter
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_base = backoff_base
-        self.client = client or httpx.Client(timeout=self.timeout)
+        self.max_retry_after = max_retry_after
+        # 1 ジョブ内の投稿で接続を使い回すため、keep-alive/HTTP2 の AsyncClient を共有する
+        self.client = client or httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=max_keepalive_connections),
+        )
         self._owns_client = client is None
         self.markdown_renderer = markdown_renderer or DefaultMarkdownRenderer()
         self.convert_markdown = convert_markdown
@@ -70,18 +85,23 @@ class WordPressClient:
         payload = self.site_adapter.extend_wp_payload(draft, payload)
         return payload
 
-    def create_draft(self, draft: ArticleDraft) -> WordPressPostResult:
+    async def create_draft(self, draft: ArticleDraft) -> WordPressPostResult:
         url = f"{self.base_url}/wp-json/wp/v2/posts"
         payload = self._build_payload(draft)
+        # 本文 HTML を含むため、リトライのたびに再シリアライズしないよう一度だけ bytes 化する
+        body = orjson.dumps(payload)
+        # リトライで同じ下書きが二重作成されないよう、プロキシ/サーバ側で重複排除できるキーを付与する
+        headers = {**self._headers, "Idempotency-Key": self._idempotency_key(draft)}
         last_error: Optional[str] = None
         last_status: Optional[int] = None
 
         for attempt in range(1, self.max_retries + 1):
+            retry_after: Optional[float] = None
             try:
-                response = self.client.post(url, json=payload, headers=self.auth_header)
+                response = await self.client.post(url, content=body, headers=headers)
                 last_status = response.status_code
                 if 200 <= response.status_code < 300:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     return WordPressPostResult(
                         success=True,
                         post_id=data.get("id"),
@@ -89,11 +109,15 @@ class WordPressClient:
                         status_code=response.status_code,
                     )
                 last_error = self._format_error(response)
+                retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
             except httpx.RequestError as exc:
                 last_error = str(exc)
             if attempt < self.max_retries:
                 sleep_seconds = self.backoff_base * (2 ** (attempt - 1))
-                time.sleep(sleep_seconds)
+                if retry_after is not None:
+                    # 429/503 の Retry-After を優先し、指定時刻より前に再送しない
+                    sleep_seconds = max(sleep_seconds, min(retry_after, self.max_retry_after))
+                await asyncio.sleep(sleep_seconds)
 
         return WordPressPostResult(
             success=False,
@@ -101,9 +125,46 @@ class WordPressClient:
             status_code=last_status,
         )
 
+    async def post_many(self, drafts: Sequence[ArticleDraft], concurrency: int = 5) -> List[WordPressPostResult]:
+        """複数の下書きを同時実行数を制限して並行投稿する。結果は drafts と同じ順序で返す。"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def post_one(draft: ArticleDraft) -> WordPressPostResult:
+            async with semaphore:
+                return await self.create_draft(draft)
+
+        outcomes = await asyncio.gather(*(post_one(d) for d in drafts), return_exceptions=True)
+        return [
+            WordPressPostResult(success=False, error_message=str(outcome))
+            if isinstance(outcome, Exception)
+            else outcome
+            for outcome in outcomes
+        ]
+
+    @staticmethod
+    def _idempotency_key(draft: ArticleDraft) -> str:
+        digest = hashlib.sha1(draft.markdown.encode("utf-8")).hexdigest()[:8]
+        return f"{draft.slug}-{digest}"
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After (秒数 or HTTP-date) を待機秒数に変換する。解釈できなければ None。"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
     def _format_error(self, response: httpx.Response) -> str:
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             msg = data.get("message") or response.text
             code = data.get("code")
             if code:
@@ -112,12 +173,12 @@ class WordPressClient:
         except Exception:
             return f"HTTP {response.status_code}: {response.text}"
 
-    def close(self) -> None:
+    async def aclose(self) -> None:
         if self._owns_client:
-            self.client.close()
+            await self.client.aclose()
 
-    def __enter__(self) -> "WordPressClient":
+    async def __aenter__(self) -> "WordPressClient":
         return self
 
-    def __exit__(self, exc_type, exc, tb) -> None:
-        self.close()
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
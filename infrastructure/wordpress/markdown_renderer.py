@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-import html
+import re
+from functools import lru_cache
 from typing import Callable
 
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as _CmarkOptions
+except ImportError:  # pragma: no cover
+    cmarkgfm = None
+
+try:
+    from markdown_it import MarkdownIt
+except ImportError:  # pragma: no cover
+    MarkdownIt = None
+
 try:
     import markdown as md_lib
 except ImportError:  # pragma: no cover
@@ -10,21 +22,49 @@ except ImportError:  # pragma: no cover
 
 from usecases.ports import MarkdownRendererPort
 
+# html.escape(quote=True) と同じ置換を str.translate の 1 パスで行うためのテーブル
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\n+")
+
+
+def _select_library_converter() -> Callable[[str], str] | None:
+    """利用可能な Markdown ライブラリを速い順 (cmarkgfm → markdown-it-py → markdown) に選ぶ。"""
+    if cmarkgfm is not None:
+        # 見出しの <!-- id:... --> などの raw HTML を markdown ライブラリと同様にそのまま通す
+        def _cmarkgfm(text: str) -> str:
+            return cmarkgfm.github_flavored_markdown_to_html(text, options=_CmarkOptions.CMARK_OPT_UNSAFE)
+
+        return _cmarkgfm
+    if MarkdownIt is not None:
+        return MarkdownIt("commonmark").enable(["table", "strikethrough"]).render
+    if md_lib is not None:
+        return md_lib.markdown
+    return None
+
+
+_library_converter = _select_library_converter()
+
+
+@lru_cache(maxsize=256)
+def _to_html_cached(markdown: str) -> str:
+    """同じ Markdown (QC 後の再投稿やリトライ) の再パースを避けるため、変換結果を本文単位でキャッシュする。"""
+    return _library_converter(markdown)
+
 
 class DefaultMarkdownRenderer(MarkdownRendererPort):
-    """軽量な Markdown -> HTML 変換。markdown が無ければ簡易変換。"""
+    """軽量な Markdown -> HTML 変換。Markdown ライブラリが無ければ簡易変換。"""
 
     def __init__(self, fallback_converter: Callable[[str], str] | None = None) -> None:
         self.fallback_converter = fallback_converter or self._simple_converter
 
     def to_html(self, markdown: str) -> str:
-        if md_lib:
-            return md_lib.markdown(markdown)
+        if _library_converter is not None:
+            return _to_html_cached(markdown)
         return self.fallback_converter(markdown)
 
     @staticmethod
     def _simple_converter(text: str) -> str:
-        escaped = html.escape(text)
-        paragraphs = escaped.split("\n\n")
-        return "".join(f"<p>{p.replace(chr(10), '<br>')}</p>" for p in paragraphs if p.strip())
-
+        escaped = text.translate(_ESCAPE_TABLE)
+        return "".join(
+            f"<p>{p.replace(chr(10), '<br>')}</p>" for p in _PARAGRAPH_SPLIT_RE.split(escaped) if p.strip()
+        )
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
-import json
 import re
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+import orjson
+from pydantic import ValidationError, parse_obj_as
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # pragma: no cover
+    re2 = None
 
 from domain.models import (
     ArticleBrief,
@@ -23,6 +38,35 @@ from domain.models import (
 )
 from usecases.ports import LLMPort, PromptRendererPort, SiteAdapterPort
 
+# QC は 1 記事あたり複数回走るため、正規表現はモジュール読み込み時に一度だけコンパイルする
+if re2 is not None:
+    # LLM 出力の行に対して最悪ケースでも線形時間で照合できるよう RE2 を使う。
+    # RE2 の \s は ASCII のみのため、標準 re (str) の \s と同じ空白文字を明示する。
+    _HEADER_RE = re2.compile(
+        r"^(?P<level>##|###) (?P<title>.+?) <!-- id:(?P<id>[^>]+) -->[\t\n\x0b\x0c\r\x1c-\x1f\x85\p{Z}]*$"
+    )
+else:
+    _HEADER_RE = re.compile(r"^(?P<level>##|###) (?P<title>.+?) <!-- id:(?P<id>[^>]+) -->\s*$")
+_ID_MARKER = "<!-- id:"
+# revise で H2 / H3 単位の再生成対象とみなす QcIssue.metric
+_H2_METRICS = frozenset({"min_h2_length", "outline_id"})
+_H3_METRICS = frozenset({"h3_length", "outline_h3_id"})
+_ASSERTIVE_KEYWORDS = ("必ず", "絶対", "断言", "保証")
+
+
+def _build_assertive_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _ASSERTIVE_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+# pyahocorasick があれば全キーワードを 1 パスで探索し、最初の一致で打ち切る
+_ASSERTIVE_AC = _build_assertive_automaton()
+
 
 def _embed_h2_with_id(title: str, h2_id: str) -> str:
     return f"## {title} <!-- id:{h2_id} -->"
@@ -32,98 +76,234 @@ def _embed_h3_with_id(title: str, h3_id: str) -> str:
     return f"### {title} <!-- id:{h3_id} -->"
 
 
-def _render_section_markdown(section: SectionDraft) -> str:
-    parts = [_embed_h2_with_id(section.h2, section.h2_id), section.body.strip()]
+def _iter_section_lines(section: SectionDraft) -> Iterator[str]:
+    yield _embed_h2_with_id(section.h2, section.h2_id)
+    yield section.body.strip()
     for h3 in section.h3_blocks:
-        parts.append(_embed_h3_with_id(h3.h3, h3.id))
-        parts.append(h3.body.strip())
-    return "\n".join(parts) + "\n"
+        yield _embed_h3_with_id(h3.h3, h3.id)
+        yield h3.body.strip()
 
 
 def assemble_markdown(plan: ArticlePlan, sections: List[SectionDraft]) -> str:
     """Plan の順序を保持しつつ H2/H3 を結合し、id コメントを埋め込む。"""
     section_map = {s.h2_id: s for s in sections}
-    ordered: List[str] = []
-    for item in plan.outline:
-        section = section_map.get(item.id)
-        if not section:
-            continue
-        ordered.append(_render_section_markdown(section))
-    return "\n".join(ordered).strip() + "\n"
+
+    def iter_lines() -> Iterator[str]:
+        first = True
+        for item in plan.outline:
+            section = section_map.get(item.id)
+            if not section:
+                continue
+            if not first:
+                # セクション間は空行で区切る
+                yield ""
+            first = False
+            yield from _iter_section_lines(section)
+
+    # セクションごとの中間文字列を作らず、全行を 1 回の join で連結する
+    return "\n".join(iter_lines()).strip() + "\n"
 
 
 def _unicode_len(text: str) -> int:
     return len(text)
 
 
-def _extract_body_lengths(markdown: str) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
-    """H2/H3 ごとの本文文字数を集計する。"""
-    h2_pattern = re.compile(r"^## (?P<title>.+?) <!-- id:(?P<id>[^>]+) -->\s*$")
-    h3_pattern = re.compile(r"^### (?P<title>.+?) <!-- id:(?P<id>[^>]+) -->\s*$")
-    h2_lengths: List[Tuple[str, int]] = []
-    h3_lengths: List[Tuple[str, int]] = []
+@dataclass
+class QcScanResult:
+    """markdown を 1 回走査して得た QC 用の集計値。
+
+    _scan_markdown の結果はキャッシュで共有されるため、呼び出し側で変更しないこと。
+    """
+
+    h2_lengths: List[Tuple[str, int]] = field(default_factory=list)
+    h3_lengths: List[Tuple[str, int]] = field(default_factory=list)
+    present_ids: Set[str] = field(default_factory=set)
+    min_h2_length: int = 0
+    min_h2_target_id: str | None = None
+    min_h3_length: int = 0
+    assertive_found: bool = False
+
+
+# 同じ本文に対する QC（Revise で本文が変わらなかった場合など）で再走査しないよう、本文文字列をキーにキャッシュする
+@lru_cache(maxsize=8)
+def _scan_markdown(markdown: str) -> QcScanResult:
+    """H2/H3 ごとの本文文字数、見出しの id、最小文字数、断定表現の有無を 1 パスで集計する。
+
+    各行の前後空白を除いた文字数を見出しごとに加算していく。H2 の本文には配下の H3 本文も含む。
+    """
+    result = QcScanResult()
     current_h2_id: str | None = None
-    current_h2_body: List[str] = []
-    current_h3_body: List[str] = []
-    in_h3 = False
+    current_h2_length = 0
     current_h3_id: str | None = None
-    lines = markdown.splitlines()
-
-    def flush_h3():
-        nonlocal current_h3_body, in_h3
-        nonlocal current_h3_id
-        if current_h3_body and in_h3 and current_h3_id:
-            body_text = "".join([l.strip() for l in current_h3_body if l.strip()])
-            h3_lengths.append((current_h3_id, _unicode_len(body_text)))
-        current_h3_body = []
-        in_h3 = False
-        current_h3_id = None
-
-    def flush_h2():
-        nonlocal current_h2_body, current_h2_id
-        if current_h2_id is not None:
-            body_text = "".join([l.strip() for l in current_h2_body if l.strip() and not h3_pattern.match(l)])
-            h2_lengths.append((current_h2_id, _unicode_len(body_text)))
-        current_h2_body = []
-
-    for line in lines:
-        h2_match = h2_pattern.match(line)
-        if h2_match:
-            flush_h3()
-            flush_h2()
-            current_h2_id = h2_match.group("id")
-            in_h3 = False
+    current_h3_length = 0
+    current_h3_has_body = False
+
+    def close_h2() -> None:
+        result.h2_lengths.append((current_h2_id, current_h2_length))
+        if result.min_h2_target_id is None or current_h2_length < result.min_h2_length:
+            result.min_h2_length = current_h2_length
+            result.min_h2_target_id = current_h2_id
+
+    def close_h3() -> None:
+        if not result.h3_lengths or current_h3_length < result.min_h3_length:
+            result.min_h3_length = current_h3_length
+        result.h3_lengths.append((current_h3_id, current_h3_length))
+
+    for line in markdown.splitlines():
+        if not result.assertive_found and _assertive_language_present(line):
+            result.assertive_found = True
+        # 見出し以外の行では正規表現の呼び出し自体を省く
+        header = _HEADER_RE.match(line) if line.startswith("##") else None
+        if header:
+            if current_h3_id is not None and current_h3_has_body:
+                close_h3()
+            current_h3_id = None
+            result.present_ids.add(header.group("id"))
+            if header.group("level") == "##":
+                if current_h2_id is not None:
+                    close_h2()
+                current_h2_id = header.group("id")
+                current_h2_length = 0
+            else:
+                current_h3_id = header.group("id")
+                current_h3_length = 0
+                current_h3_has_body = False
             continue
-        h3_match = h3_pattern.match(line)
-        if h3_match:
-            flush_h3()
-            current_h3_body = []
-            in_h3 = True
-            current_h3_id = h3_match.group("id")
+        # Accumulate body lengths
+        if current_h2_id is None and current_h3_id is None:
             continue
-        # Accumulate body lines
-        if in_h3:
-            current_h3_body.append(line)
+        # 文中の空白も本文文字数に含める仕様のため、translate で空白を全除去せず前後空白だけを落とす
+        length = len(line.strip())
+        if current_h3_id is not None:
+            current_h3_length += length
+            current_h3_has_body = True
         if current_h2_id is not None:
-            current_h2_body.append(line)
+            current_h2_length += length
+
+    if current_h3_id is not None and current_h3_has_body:
+        close_h3()
+    if current_h2_id is not None:
+        close_h2()
+    return result
+
+
+def _assertive_language_present(text: str) -> bool:
+    if _ASSERTIVE_AC is not None:
+        return next(_ASSERTIVE_AC.iter(text), None) is not None
+    return any(keyword in text for keyword in _ASSERTIVE_KEYWORDS)
 
-    flush_h3()
-    flush_h2()
-    return h2_lengths, h3_lengths
 
+@dataclass(frozen=True)
+class SectionMetrics:
+    """SectionDraft 1 件分の QC 集計値。assemble_markdown 後の markdown を走査した場合と同じ値になる。"""
 
-def _assertive_language_present(markdown: str) -> bool:
-    return bool(re.search(r"(必ず|絶対|断言|保証)", markdown))
+    h2_id: str
+    h2_length: int
+    h3_lengths: Tuple[Tuple[str, int], ...]
+    ids: Tuple[str, ...]
+    assertive_found: bool
+    # 最後の H3 の本文が空。記事末尾のセクションでは末尾の空行が strip されるため、この H3 は集計対象外になる
+    last_h3_empty: bool
+
+
+def _is_plain_header(line: str, level: str, header_id: str) -> bool:
+    header = _HEADER_RE.match(line)
+    return (
+        header is not None
+        and header.group("level") == level
+        and header.group("id") == header_id
+        and len(line.splitlines()) == 1
+    )
+
+
+def _body_length(body: str) -> int:
+    return sum(len(line.strip()) for line in body.strip().splitlines())
+
+
+@lru_cache(maxsize=256)
+def _section_metrics_cached(
+    h2: str, h2_id: str, body: str, h3_blocks: Tuple[Tuple[str, str, str], ...]
+) -> SectionMetrics | None:
+    h2_line = _embed_h2_with_id(h2, h2_id)
+    # 見出しとして解釈されない見出し行や、本文中の id コメントは markdown 走査と結果が変わるので扱わない
+    if not _is_plain_header(h2_line, "##", h2_id) or _ID_MARKER in body:
+        return None
+    h2_length = _body_length(body)
+    h3_lengths: List[Tuple[str, int]] = []
+    ids = [h2_id]
+    texts = [h2_line, body]
+    for h3_id, h3_title, h3_body in h3_blocks:
+        h3_line = _embed_h3_with_id(h3_title, h3_id)
+        if not _is_plain_header(h3_line, "###", h3_id) or _ID_MARKER in h3_body:
+            return None
+        length = _body_length(h3_body)
+        h2_length += length
+        h3_lengths.append((h3_id, length))
+        ids.append(h3_id)
+        texts.extend((h3_line, h3_body))
+    return SectionMetrics(
+        h2_id=h2_id,
+        h2_length=h2_length,
+        h3_lengths=tuple(h3_lengths),
+        ids=tuple(ids),
+        assertive_found=any(_assertive_language_present(text) for text in texts),
+        last_h3_empty=bool(h3_blocks) and not h3_blocks[-1][2].strip(),
+    )
+
+
+def _section_metrics(section: SectionDraft) -> SectionMetrics | None:
+    """セクションの QC 集計値を返す。内容が同じセクションは再計算しない。markdown 走査が必要な場合は None。"""
+    h3_blocks = tuple((h3.id, h3.h3, h3.body) for h3 in section.h3_blocks)
+    return _section_metrics_cached(section.h2, section.h2_id, section.body, h3_blocks)
+
+
+def _scan_sections(outline: List[OutlineItem], sections: List[SectionDraft]) -> QcScanResult | None:
+    """assemble_markdown した markdown を _scan_markdown で走査した場合と同じ集計を、セクション単位の集計値から組み立てる。"""
+    section_map = {s.h2_id: s for s in sections}
+    ordered: List[SectionMetrics] = []
+    for item in outline:
+        section = section_map.get(item.id)
+        if not section:
+            continue
+        metrics = _section_metrics(section)
+        if metrics is None:
+            return None
+        ordered.append(metrics)
+
+    result = QcScanResult()
+    for index, metrics in enumerate(ordered):
+        h3_lengths = metrics.h3_lengths
+        if metrics.last_h3_empty and index == len(ordered) - 1:
+            h3_lengths = h3_lengths[:-1]
+        for h3_id, length in h3_lengths:
+            if not result.h3_lengths or length < result.min_h3_length:
+                result.min_h3_length = length
+            result.h3_lengths.append((h3_id, length))
+        result.h2_lengths.append((metrics.h2_id, metrics.h2_length))
+        if result.min_h2_target_id is None or metrics.h2_length < result.min_h2_length:
+            result.min_h2_length = metrics.h2_length
+            result.min_h2_target_id = metrics.h2_id
+        result.present_ids.update(metrics.ids)
+        result.assertive_found = result.assertive_found or metrics.assertive_found
+    return result
 
 
 def run_qc(draft: ArticleDraft) -> QcReport:
-    h2_lengths, h3_lengths = _extract_body_lengths(draft.markdown)
-    h2_count = len(h2_lengths)
-    h3_count = len(h3_lengths)
+    """draft の QC を行う。
+
+    sections を持つ draft（markdown は assemble_markdown(outline, sections) の結果）は、markdown を正規表現で
+    走査せずセクション単位の集計値から計測する。sections がない場合や走査結果と一致しない可能性がある場合は
+    markdown を走査する。
+    """
+    scan = _scan_sections(draft.outline, draft.sections) if draft.sections else None
+    if scan is None:
+        scan = _scan_markdown(draft.markdown)
+    h2_count = len(scan.h2_lengths)
+    h3_count = len(scan.h3_lengths)
     meta_description_length = _unicode_len(draft.meta_description.strip())
     markdown_length = _unicode_len(draft.markdown)
-    min_h2_length = min(h2_lengths, key=lambda x: x[1])[1] if h2_lengths else 0
-    min_h3_length = min(h3_lengths, key=lambda x: x[1])[1] if h3_lengths else 0
+    min_h2_length = scan.min_h2_length
+    min_h3_length = scan.min_h3_length
     faq_count = len(draft.faq)
 
     measurements = QualitySelfCheck(
@@ -134,7 +314,7 @@ def run_qc(draft: ArticleDraft) -> QcReport:
         min_h2_length=min_h2_length,
         min_h3_length=min_h3_length,
         faq_count=faq_count,
-        assertive_language_found=_assertive_language_present(draft.markdown),
+        assertive_language_found=scan.assertive_found,
         regenerate_required=False,
     )
 
@@ -159,17 +339,16 @@ def run_qc(draft: ArticleDraft) -> QcReport:
         )
 
     if min_h2_length < 300:
-        target = next((h2_id for h2_id, length in h2_lengths if length == min_h2_length), None)
         issues.append(
             QcIssue(
                 message=f"H2 本文が短い ({min_h2_length} 文字)",
                 severity=QcSeverity.hard,
-                target_id=target,
+                target_id=scan.min_h2_target_id,
                 metric="min_h2_length",
             )
         )
 
-    for h3_id, length in h3_lengths:
+    for h3_id, length in scan.h3_lengths:
         if length < 80:
             issues.append(
                 QcIssue(
@@ -198,8 +377,9 @@ def run_qc(draft: ArticleDraft) -> QcReport:
             )
         )
 
-    outline_ids = {item.id for item in draft.outline}
-    missing_ids = [oid for oid in outline_ids if f"id:{oid}" not in draft.markdown]
+    # 見出しの id は走査時に集めてあるので、outline id ごとに markdown 全体を検索しない。
+    # issue の順序が revise の指示順になるため、集合の順ではなく outline の順に並べる（重複 id は 1 件にまとめる）
+    missing_ids = list(dict.fromkeys(item.id for item in draft.outline if item.id not in scan.present_ids))
     if missing_ids:
         for oid in missing_ids:
             issues.append(
@@ -210,8 +390,9 @@ def run_qc(draft: ArticleDraft) -> QcReport:
                     metric="outline_id",
                 )
             )
-    h3_outline_ids = {h3.id for item in draft.outline for h3 in item.h3}
-    missing_h3_ids = [hid for hid in h3_outline_ids if f"id:{hid}" not in draft.markdown]
+    missing_h3_ids = list(
+        dict.fromkeys(h3.id for item in draft.outline for h3 in item.h3 if h3.id not in scan.present_ids)
+    )
     if missing_h3_ids:
         for hid in missing_h3_ids:
             issues.append(
@@ -238,10 +419,22 @@ def run_qc(draft: ArticleDraft) -> QcReport:
 class LLMOrchestrator:
     """Plan → Draft → QC → Revise を連携するオーケストレータ。"""
 
-    def __init__(self, llm: LLMPort, prompt_renderer: PromptRendererPort, site_adapter: SiteAdapterPort):
+    def __init__(
+        self,
+        llm: LLMPort,
+        prompt_renderer: PromptRendererPort,
+        site_adapter: SiteAdapterPort,
+        *,
+        parallel_sections: bool = False,
+        max_section_workers: int | None = None,
+    ):
         self.llm = llm
         self.prompt_renderer = prompt_renderer
         self.site_adapter = site_adapter
+        # True の場合、各セクションを previous_sections なしで並行生成する（llm はスレッドセーフであること）。
+        # プロンプトが生成済みセクションを参照して重複回避する場合は False のまま逐次生成する。
+        self.parallel_sections = parallel_sections
+        self.max_section_workers = max_section_workers
 
     def plan_article(
         self,
@@ -269,25 +462,67 @@ class LLMOrchestrator:
         for attempt in range(2):
             raw = self.llm.complete(prompt, temperature=0.2)
             try:
-                data = json.loads(raw)
+                data = orjson.loads(raw)
                 return BatchPlan.parse_obj(data)
             except Exception:
                 continue
         return BatchPlan(batch_id="failed", items=[])
 
     def draft_section(
-        self, plan: ArticlePlan, outline_item: OutlineItem, previous_sections: List[SectionDraft]
+        self,
+        plan: ArticlePlan,
+        outline_item: OutlineItem,
+        previous_sections: List[SectionDraft],
+        *,
+        plan_dict: Dict[str, Any] | None = None,
+        previous_sections_dicts: List[Dict[str, Any]] | None = None,
     ) -> SectionDraft:
-        prompt = self.prompt_renderer.render_section_prompt(plan, outline_item, previous_sections, self.site_adapter)
+        prompt = self.prompt_renderer.render_section_prompt(
+            plan,
+            outline_item,
+            previous_sections,
+            self.site_adapter,
+            plan_dict_cached=plan_dict,
+            previous_sections_dicts=previous_sections_dicts,
+        )
         prompt = self.site_adapter.apply_site_tone(prompt)
         raw = self.llm.complete(prompt, temperature=0.7)
         return self.site_adapter.parse_section_response(raw, outline_item)
 
-    def draft_article(self, plan: ArticlePlan) -> Tuple[ArticleDraft, QcReport]:
+    def _draft_sections_sequential(self, plan: ArticlePlan, plan_dict: Dict[str, Any]) -> List[SectionDraft]:
         sections: List[SectionDraft] = []
+        previous_sections_dicts: List[Dict[str, Any]] = []
         for item in plan.outline:
-            section = self.draft_section(plan, item, sections)
+            section = self.draft_section(
+                plan,
+                item,
+                sections,
+                plan_dict=plan_dict,
+                previous_sections_dicts=previous_sections_dicts,
+            )
             sections.append(section)
+            previous_sections_dicts.append(section.dict())
+        return sections
+
+    def _draft_sections_parallel(self, plan: ArticlePlan, plan_dict: Dict[str, Any]) -> List[SectionDraft]:
+        if not plan.outline:
+            return []
+        max_workers = self.max_section_workers or len(plan.outline)
+
+        def draft(item: OutlineItem) -> SectionDraft:
+            return self.draft_section(plan, item, [], plan_dict=plan_dict, previous_sections_dicts=[])
+
+        # executor.map は outline の順序で結果を返す
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(draft, plan.outline))
+
+    def draft_article(self, plan: ArticlePlan) -> Tuple[ArticleDraft, QcReport]:
+        # plan と生成済みセクションの dict は記事内で使い回し、セクションごとの再シリアライズを避ける
+        plan_dict = plan.dict()
+        if self.parallel_sections:
+            sections = self._draft_sections_parallel(plan, plan_dict)
+        else:
+            sections = self._draft_sections_sequential(plan, plan_dict)
 
         markdown = assemble_markdown(plan, sections)
         draft = ArticleDraft(
@@ -310,14 +545,19 @@ class LLMOrchestrator:
     def revise(self, draft: ArticleDraft, qc_report: QcReport) -> ReviseRequest:
         reasons = [issue.message for issue in qc_report.issues]
         sections_to_regenerate: List[str] = []
+        # H3 id → 親 H2 id。id の命名規則に頼らず outline の構造から引く
+        h3_parent = {h3.id: item.id for item in draft.outline for h3 in item.h3}
         for issue in qc_report.issues:
-            if issue.metric in {"min_h2_length", "outline_id"} and issue.target_id:
+            if issue.metric in _H2_METRICS and issue.target_id:
                 sections_to_regenerate.append(issue.target_id)
-            if issue.metric in {"h3_length", "outline_h3_id"} and issue.target_id:
+            if issue.metric in _H3_METRICS and issue.target_id:
                 # regenerate parent H2 as well for simplicity
-                parent_h2 = issue.target_id.split("-")[1] if "-" in issue.target_id else None
+                parent_h2 = h3_parent.get(issue.target_id)
+                if parent_h2 is None and "-" in issue.target_id:
+                    # outline にない H3 id（LLM が独自に付けた id など）は従来どおり id から推測する
+                    parent_h2 = f"h2-{issue.target_id.split('-')[1]}"
                 if parent_h2:
-                    sections_to_regenerate.append(f"h2-{parent_h2}")
+                    sections_to_regenerate.append(parent_h2)
         return ReviseRequest(
             sections_to_regenerate=sections_to_regenerate,
             reasons=reasons,
@@ -328,8 +568,8 @@ class LLMOrchestrator:
         prompt = self.prompt_renderer.render_qc_soft_prompt(draft)
         raw = self.llm.complete(prompt, temperature=0.0)
         try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             return {"fix_targets": [], "fix_instructions": {}, "overall_notes": "JSON parse failed"}
         return {
             "fix_targets": data.get("fix_targets", []),
@@ -342,12 +582,15 @@ class LLMOrchestrator:
     ) -> List[SectionDraft]:
         replace_map = {s.h2_id: s for s in replacements}
         result: List[SectionDraft] = []
+        present: Set[str] = set()
         for sec in base_sections:
             result.append(replace_map.get(sec.h2_id, sec))
+            present.add(sec.h2_id)
         # 追加で新規 id があれば末尾に足す
         for h2_id, sec in replace_map.items():
-            if not any(s.h2_id == h2_id for s in result):
+            if h2_id not in present:
                 result.append(sec)
+                present.add(h2_id)
         return result
 
     def _apply_revise(
@@ -360,32 +603,35 @@ class LLMOrchestrator:
         prompt = self.prompt_renderer.render_revise_prompt(draft, instructions, targets)
         raw = self.llm.complete(prompt, temperature=0.3)
         try:
-            data = json.loads(raw)
+            data = orjson.loads(raw)
             sections_data = data.get("sections", [])
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             sections_data = []
-        new_sections: List[SectionDraft] = []
-        for s in sections_data:
-            try:
-                new_sections.append(SectionDraft.parse_obj(s))
-            except Exception:
-                continue
+        try:
+            # 通常はリスト全体を一括で検証する
+            new_sections: List[SectionDraft] = parse_obj_as(List[SectionDraft], sections_data)
+        except ValidationError:
+            # 一部の要素が不正な場合のみ、要素ごとに検証して不正なものを捨てる
+            new_sections = []
+            for s in sections_data:
+                try:
+                    new_sections.append(SectionDraft.parse_obj(s))
+                except Exception:
+                    continue
 
         merged_sections = self._replace_sections(draft.sections, new_sections)
         markdown = assemble_markdown(plan, merged_sections)
-        revised_draft = draft.copy(
-            update={
-                "markdown": markdown,
-                "sections": merged_sections,
-                "outline": plan.outline,
-                "tags_suggestions": plan.tags_suggestions,
-                "volatile_topics": plan.volatile_topics,
-                "safe_assertions": plan.safe_assertions,
-            }
-        )
-        qc_report = run_qc(revised_draft)
-        revised_draft.quality_self_check = qc_report.measurements
-        return revised_draft, qc_report
+        # 呼び出し元は戻り値の draft で置き換えるため、コピーを作らず渡された draft を直接更新する
+        draft.markdown = markdown
+        draft.sections = merged_sections
+        draft.outline = plan.outline
+        draft.tags_suggestions = plan.tags_suggestions
+        draft.volatile_topics = plan.volatile_topics
+        draft.safe_assertions = plan.safe_assertions
+        # 差し替えのないセクションは集計値がキャッシュ済みのため、差し替えたセクションだけが再集計される
+        qc_report = run_qc(draft)
+        draft.quality_self_check = qc_report.measurements
+        return draft, qc_report
 
     # _markdown_to_sections は現在のメインフローでは未使用。必要に応じて残す。
 
@@ -393,8 +639,8 @@ class LLMOrchestrator:
         prompt = self.prompt_renderer.render_faq_prompt(draft)
         raw = self.llm.complete(prompt, temperature=0.2)
         try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             return []
         faq = data.get("faq", [])
         return faq if isinstance(faq, list) else []
@@ -430,7 +676,9 @@ def create_article_draft(
 
     # FAQ 生成
     draft.faq = orchestrator.generate_faq(draft)
-    final_qc = run_qc(draft)
+    # FAQ は faq_count 以外の指標に影響しないため、markdown を再走査せず直前の QC 結果を更新する
+    qc_report.measurements.faq_count = len(draft.faq)
+    final_qc = qc_report
     draft.quality_self_check = final_qc.measurements
     if final_qc.hard_failed:
         revise_request = orchestrator.revise(draft, final_qc)
@@ -478,20 +726,17 @@ def _retry_hard_fail(
     return draft, qc_report, revise_request
 
 
-def _collect_existing(plans: List[ArticlePlan]) -> Tuple[List[str], List[str], List[str]]:
-    titles = [p.title for p in plans]
-    angles: List[str] = []
-    avoid: List[str] = []
-    for p in plans:
-        constraints = getattr(p, "constraints", None)
-        if isinstance(constraints, dict):
-            angle = constraints.get("angle")
-            if angle:
-                angles.append(angle)
-            avoid_overlap = constraints.get("avoid_overlap_with")
-            if avoid_overlap and isinstance(avoid_overlap, list):
-                avoid.extend(avoid_overlap)
-    return titles, angles, avoid
+def _add_existing(plan: ArticlePlan, titles: List[str], angles: List[str], avoid: List[str]) -> None:
+    """生成済み plan のタイトル・切り口・重複回避対象を既存リストに追加する。"""
+    titles.append(plan.title)
+    constraints = getattr(plan, "constraints", None)
+    if isinstance(constraints, dict):
+        angle = constraints.get("angle")
+        if angle:
+            angles.append(angle)
+        avoid_overlap = constraints.get("avoid_overlap_with")
+        if avoid_overlap and isinstance(avoid_overlap, list):
+            avoid.extend(avoid_overlap)
 
 
 def create_batch_drafts(
@@ -501,11 +746,13 @@ def create_batch_drafts(
     drafts: List[ArticleDraft] = []
     qc_reports: List[QcReport] = []
     revise_requests: List[ReviseRequest | None] = []
-    successful_plans: List[ArticlePlan] = []
+    # 成功した plan ごとに追記し、記事ごとに全 plan から作り直さない
+    existing_titles: List[str] = []
+    existing_angles: List[str] = []
+    existing_avoid: List[str] = []
 
     for item in batch_plan.items:
         brief = _batch_item_to_brief(item, batch_brief.target_site, batch_brief.topic)
-        existing_titles, existing_angles, existing_avoid = _collect_existing(successful_plans)
         plan = orchestrator.plan_article(
             brief,
             existing_titles=existing_titles,
@@ -537,6 +784,6 @@ def create_batch_drafts(
         drafts.append(draft)
         qc_reports.append(qc_report)
         revise_requests.append(revise_request)
-        successful_plans.append(plan)
+        _add_existing(plan, existing_titles, existing_angles, existing_avoid)
 
     return drafts, qc_reports, revise_requests
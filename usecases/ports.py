@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import AsyncContextManager, Protocol
 
 from domain.models import ArticleBrief, ArticleDraft, ArticlePlan, BatchBrief, OutlineItem, SectionDraft
 
 
 class LLMPort(Protocol):
-    """LLM への依存を抽象化。"""
+    """LLM への依存を抽象化。
+
+    run_batch_job（concurrency > 1）や LLMOrchestrator(parallel_sections=True) からは複数スレッドで同時に
+    complete が呼ばれるため、実装はスレッドセーフであること。
+    """
 
     def complete(self, prompt: str, *, temperature: float = 0.0, max_tokens: int | None = None) -> str:
         ...
@@ -34,6 +38,9 @@ class PromptRendererPort(Protocol):
         outline_item: OutlineItem,
         previous_sections: list[SectionDraft],
         site_adapter: "SiteAdapterPort",
+        *,
+        plan_dict_cached: dict | None = None,
+        previous_sections_dicts: list[dict] | None = None,
     ) -> str:
         ...
 
@@ -77,14 +84,29 @@ class SiteAdapterPort(Protocol):
         ...
 
 
+class JobSubscription(Protocol):
+    """1 ジョブの更新通知の購読。JobStorePort.subscribe から受け取る。"""
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """前回の wait 以降（初回は購読開始以降）に update があれば True。timeout までに無ければ False。"""
+        ...
+
+
 class JobStorePort(Protocol):
-    """ジョブ状態の永続化を抽象化。"""
+    """ジョブ状態の永続化を抽象化。イベントループを塞がないよう、すべて async で提供する。"""
+
+    async def create(self, job: "JobState") -> None:
+        ...
 
-    def create(self, job: "JobState") -> None:
+    async def get(self, job_id: str) -> "JobState | None":
         ...
 
-    def get(self, job_id: str) -> "JobState | None":
+    async def update(self, job: "JobState") -> None:
         ...
 
-    def update(self, job: "JobState") -> None:
+    def subscribe(self, job_id: str) -> AsyncContextManager[JobSubscription]:
+        """ジョブの更新通知を購読する。
+
+        購読を開始してから get し直せば、それ以降の update は wait で必ず検知できる。
+        """
         ...
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import bisect
 import datetime
+from operator import attrgetter
 from typing import List, Tuple
 
 from domain.models import (
     ArticleBrief,
+    ArticleDraft,
+    ArticlePlan,
     BatchBrief,
     BatchPlanItem,
     JobResultItem,
     JobState,
     JobStatus,
+    QcReport,
 )
 from infrastructure.wordpress.client import WordPressClient
-from usecases.create_drafts import LLMOrchestrator, run_qc
+from usecases.create_drafts import LLMOrchestrator
 from usecases.ports import JobStorePort
 
+_RESULT_INDEX = attrgetter("index")
+
 
 def _now_iso() -> str:
     return datetime.datetime.utcnow().isoformat() + "Z"
@@ -35,28 +43,52 @@ def _batch_item_to_brief(item: BatchPlanItem, batch_brief: BatchBrief) -> Articl
     )
 
 
-def _collect_existing(plans: List) -> Tuple[List[str], List[str], List[str]]:
-    titles = []
-    angles: List[str] = []
-    avoid: List[str] = []
-    for p in plans:
-        titles.append(p.title)
-        constraints = getattr(p, "constraints", None)
-        if isinstance(constraints, dict):
-            angle = constraints.get("angle")
-            if angle:
-                angles.append(angle)
-            avoid_overlap = constraints.get("avoid_overlap_with")
-            if avoid_overlap and isinstance(avoid_overlap, list):
-                avoid.extend(avoid_overlap)
-    return titles, angles, avoid
+def _add_existing(plan: ArticlePlan, titles: List[str], angles: List[str], avoid: List[str]) -> None:
+    """生成済み plan のタイトル・切り口・重複回避対象を既存リストに追加する。"""
+    titles.append(plan.title)
+    constraints = getattr(plan, "constraints", None)
+    if isinstance(constraints, dict):
+        angle = constraints.get("angle")
+        if angle:
+            angles.append(angle)
+        avoid_overlap = constraints.get("avoid_overlap_with")
+        if avoid_overlap and isinstance(avoid_overlap, list):
+            avoid.extend(avoid_overlap)
 
 
 def _append_log(job: JobState, message: str) -> None:
     job.logs.append(message)
 
 
-def run_batch_job(
+def _generate_article(orchestrator: LLMOrchestrator, plan: ArticlePlan) -> Tuple[ArticleDraft, QcReport]:
+    """1 記事分の Draft → Soft QC/Revise → FAQ を同期的に実行する。"""
+    draft, qc_report = orchestrator.draft_article(plan)
+
+    # Soft QC / Revise loop (最大 2 回) + FAQ
+    if not qc_report.hard_failed:
+        for _ in range(2):
+            if not qc_report.soft_failed:
+                break
+            soft_qc = orchestrator._soft_qc(draft)
+            targets = soft_qc.get("fix_targets", [])
+            inst_map = soft_qc.get("fix_instructions", {})
+            instructions = [inst_map.get(t, f"Fix {t}") for t in targets]
+            if not targets:
+                break
+            draft, qc_report = orchestrator._apply_revise(draft, plan, targets, instructions)
+            if qc_report.hard_failed:
+                break
+
+        if not qc_report.hard_failed:
+            draft.faq = orchestrator.generate_faq(draft)
+            # FAQ は faq_count 以外の指標に影響しないため、run_qc で markdown を再走査しない
+            qc_report.measurements.faq_count = len(draft.faq)
+            draft.quality_self_check = qc_report.measurements
+
+    return draft, qc_report
+
+
+async def run_batch_job(
     job_id: str,
     batch_brief: BatchBrief,
     wordpress_url: str,
@@ -64,12 +96,24 @@ def run_batch_job(
     wordpress_app_password: str,
     job_store: JobStorePort,
     orchestrator_provider,
+    concurrency: int = 5,
 ) -> JobState:
-    job = job_store.get(job_id) or JobState(job_id=job_id, status=JobStatus.queued, total=batch_brief.desired_count)
+    """バッチジョブを実行する。
+
+    LLM 呼び出しは同期 API のためワーカースレッドに逃がす。Plan は重複回避のため記事順に 1 件ずつ作成し、
+    それまでの全 Plan を渡す。Draft → Soft QC/Revise → FAQ は Plan と合わせて最大 concurrency 件を並行処理する。
+    Draft OK の記事は生成完了後に post_many でまとめて（同じく最大 concurrency 件ずつ）並行投稿する。
+    concurrency は LLM プロバイダのレート制限に合わせて調整すること。
+    concurrency が 2 以上の場合、orchestrator の llm.complete は複数スレッドから同時に呼ばれるため、
+    LLMPort の実装はスレッドセーフであること（そうでなければ concurrency=1 で実行する）。
+    """
+    job = await job_store.get(job_id)
+    if job is None:
+        job = JobState(job_id=job_id, status=JobStatus.queued, total=batch_brief.desired_count)
     job.status = JobStatus.running
     job.started_at = _now_iso()
     job.total = batch_brief.desired_count
-    job_store.update(job)
+    await job_store.update(job)
 
     wp_client: WordPressClient | None = None
     try:
@@ -81,75 +125,88 @@ def run_batch_job(
             site_adapter=orchestrator.site_adapter,
         )
 
-        batch_plan = orchestrator.batch_plan(batch_brief)
+        batch_plan = await asyncio.to_thread(orchestrator.batch_plan, batch_brief)
         job.total = len(batch_plan.items)
-        job_store.update(job)
-        successful_plans = []
+        await job_store.update(job)
+        # plan が作成されるたびに追記し、記事ごとに全 plan から作り直さない
+        existing_titles: List[str] = []
+        existing_angles: List[str] = []
+        existing_avoid: List[str] = []
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        # Draft OK の記事は生成完了後に post_many でまとめて並行投稿する
+        pending_posts: List[Tuple[JobResultItem, ArticleDraft]] = []
+
+        async def record(result: JobResultItem) -> None:
+            # job の更新はイベントループ上でのみ行う。完了順に関わらず results は index 順に保つ
+            bisect.insort(job.results, result, key=_RESULT_INDEX)
+            job.current += 1
+            await job_store.update(job)
+
+        async def generate(idx: int, plan: ArticlePlan) -> None:
+            async with semaphore:
+                result = JobResultItem(index=idx, title=plan.title)
+                try:
+                    draft, qc_report = await asyncio.to_thread(_generate_article, orchestrator, plan)
+                    result.title = draft.title
 
+                    if qc_report.hard_failed:
+                        result.draft_ok = False
+                        result.error = "; ".join([iss.message for iss in qc_report.issues])
+                        _append_log(job, f"[{idx+1}/{job.total}] Draft failed: {result.error}")
+                        return
+
+                    result.draft_ok = True
+                    pending_posts.append((result, draft))
+                    _append_log(job, f"[{idx+1}/{job.total}] Draft ready")
+                except Exception as exc:
+                    # 1 記事の失敗で他の記事を止めない
+                    result.error = str(exc)
+                    _append_log(job, f"[{idx+1}/{job.total}] Failed: {exc}")
+                finally:
+                    await record(result)
+
+        tasks: List[asyncio.Task] = []
         for idx, item in enumerate(batch_plan.items):
             brief = _batch_item_to_brief(item, batch_brief)
-            existing_titles, existing_angles, existing_avoid = _collect_existing(successful_plans)
-            plan = orchestrator.plan_article(
-                brief,
-                existing_titles=existing_titles,
-                existing_angles=existing_angles,
-                existing_avoid=existing_avoid,
-            )
-
-            draft, qc_report = orchestrator.draft_article(plan)
-
-            # Soft QC / Revise loop (最大 2 回) + FAQ
-            if not qc_report.hard_failed:
-                for _ in range(2):
-                    if not qc_report.soft_failed:
-                        break
-                    soft_qc = orchestrator._soft_qc(draft)
-                    targets = soft_qc.get("fix_targets", [])
-                    inst_map = soft_qc.get("fix_instructions", {})
-                    instructions = [inst_map.get(t, f"Fix {t}") for t in targets]
-                    if not targets:
-                        break
-                    draft, qc_report = orchestrator._apply_revise(draft, plan, targets, instructions)
-                    if qc_report.hard_failed:
-                        break
-
-                if not qc_report.hard_failed:
-                    draft.faq = orchestrator.generate_faq(draft)
-                    qc_report = run_qc(draft)
-                    draft.quality_self_check = qc_report.measurements
-
-            result = JobResultItem(index=idx, title=draft.title)
-
-            if qc_report.hard_failed:
-                result.draft_ok = False
-                result.error = "; ".join([iss.message for iss in qc_report.issues])
-                _append_log(job, f"[{idx+1}/{job.total}] Draft failed: {result.error}")
+            try:
+                # existing_* は plan の作成中に変更されないため、コピーせずに渡せる
+                async with semaphore:
+                    plan = await asyncio.to_thread(
+                        orchestrator.plan_article,
+                        brief,
+                        existing_titles=existing_titles,
+                        existing_angles=existing_angles,
+                        existing_avoid=existing_avoid,
+                    )
+            except Exception as exc:
+                _append_log(job, f"[{idx+1}/{job.total}] Failed: {exc}")
+                await record(JobResultItem(index=idx, title=item.title, error=str(exc)))
+                continue
+            _add_existing(plan, existing_titles, existing_angles, existing_avoid)
+            tasks.append(asyncio.create_task(generate(idx, plan)))
+        await asyncio.gather(*tasks)
+
+        pending_posts.sort(key=lambda pending: pending[0].index)
+        wp_results = await wp_client.post_many([draft for _, draft in pending_posts], concurrency=max(1, concurrency))
+        for (result, _), wp_res in zip(pending_posts, wp_results):
+            result.wp_ok = wp_res.success
+            result.wp_post_id = wp_res.post_id
+            result.wp_url = wp_res.url
+            result.error = wp_res.error_message
+            if result.wp_ok:
+                _append_log(job, f"[{result.index+1}/{job.total}] WP draft created: {result.wp_url}")
             else:
-                result.draft_ok = True
-                wp_res = wp_client.create_draft(draft)
-                result.wp_ok = wp_res.success
-                result.wp_post_id = wp_res.post_id
-                result.wp_url = wp_res.url
-                result.error = wp_res.error_message
-                if result.wp_ok:
-                    _append_log(job, f"[{idx+1}/{job.total}] WP draft created: {result.wp_url}")
-                else:
-                    _append_log(job, f"[{idx+1}/{job.total}] WP draft failed: {result.error}")
-
-            job.results.append(result)
-            job.current += 1
-            job_store.update(job)
-            successful_plans.append(plan)
+                _append_log(job, f"[{result.index+1}/{job.total}] WP draft failed: {result.error}")
 
         job.status = JobStatus.done
         job.finished_at = _now_iso()
-        job_store.update(job)
+        await job_store.update(job)
     except Exception as exc:
         _append_log(job, f"Job failed: {exc}")
         job.status = JobStatus.failed
         job.finished_at = _now_iso()
-        job_store.update(job)
+        await job_store.update(job)
     finally:
         if wp_client:
-            wp_client.close()
+            await wp_client.aclose()
         return job